@@ -5,6 +5,7 @@ from tests.test_model import BasicTestModel
 from tests.test_space import TestLatLonGridAPI, TestGridComparison
 from tests.test_time import TestTimeDomainAPI, TestTimeDomainComparison
 from tests.test_utils.test_clock import TestClock
+from tests.test_utils.test_exchanger import TestExchanger
 from tests.test_component import TestSubstituteComponent
 import unifhy
 
@@ -39,6 +40,7 @@ if __name__ == "__main__":
     test_suite.addTests(test_loader.loadTestsFromTestCase(TestTimeDomainAPI))
     test_suite.addTests(test_loader.loadTestsFromTestCase(TestTimeDomainComparison))
     test_suite.addTests(test_loader.loadTestsFromTestCase(TestClock))
+    test_suite.addTests(test_loader.loadTestsFromTestCase(TestExchanger))
     test_suite.addTests(test_loader.loadTestsFromTestCase(TestSubstituteComponent))
 
     test_suite.addTests(doctest.DocTestSuite(unifhy.data))
@@ -827,7 +827,7 @@ class BasicTestModel(object):
             "transfer_o",
             "transfer_p",
         ]:
-            arr = exchanger.transfers[transfer]["slices"][-1]
+            arr = exchanger.get_latest_transfer(transfer)
             cat = exchanger.transfers[transfer]["src_cat"]
             # compare both min/max, as array should be homogeneous
             val = exp_records_raw[self.t][cat][transfer][-1]
@@ -1,5 +1,6 @@
 import unittest
 import doctest
+import numpy as np
 
 import unifhy._utils
 from ..test_time import (
@@ -247,6 +248,108 @@ class TestClock(unittest.TestCase):
         self.assertEqual(out_idx_e, self.exp_idx_e)
         self.assertEqual(out_idx_f, self.exp_idx_f)
 
+    def test_clock_batch_iteration(self):
+        clock = unifhy._utils.Clock(
+            {
+                "surfacelayer": self.td_a,
+                "subsurface": self.td_b,
+                "openwater": self.td_c,
+                "nutrientsurfacelayer": self.td_d,
+                "nutrientsubsurface": self.td_e,
+                "nutrientopenwater": self.td_f,
+            },
+        )
+        clock.set_dumping_frequency(dumping_frequency=self.dumping)
+
+        out_bool = [list() for _ in range(7)]
+        out_idx_b = list()
+        out_datetimes = list()
+
+        for chunk in clock.batch(5):
+            # chunks are of requested size, except the last one
+            self.assertEqual(chunk.shape, (7, min(5, 16 - len(out_bool[0]))))
+            # chunks are views on the switches that cannot be modified
+            self.assertFalse(chunk.flags.writeable)
+            for row, out in zip(chunk.tolist(), out_bool):
+                out.extend(row)
+            out_idx_b.append(clock.get_current_timeindex("subsurface"))
+            out_datetimes.append(clock.get_current_datetime())
+
+        self.assertEqual(out_bool[0], self.exp_bool_a)
+        self.assertEqual(out_bool[1], self.exp_bool_b)
+        self.assertEqual(out_bool[2], self.exp_bool_c)
+        self.assertEqual(out_bool[3], self.exp_bool_d)
+        self.assertEqual(out_bool[4], self.exp_bool_e)
+        self.assertEqual(out_bool[5], self.exp_bool_f)
+        self.assertEqual(out_bool[6], self.exp_bool_g)
+
+        # clock is left on last step of each chunk
+        self.assertEqual(out_idx_b, [1, 2, 3, 3])
+        self.assertEqual(
+            out_datetimes,
+            [self.td_a.bounds.datetime_array[i, 0] for i in (4, 9, 14, 15)],
+        )
+
+    def test_clock_iteration_many_switches(self):
+        # more than 8 rows of switches cannot be encoded in one byte per step
+        timedomains = [self.td_a, self.td_b, self.td_c, self.td_d, self.td_e]
+        clock = unifhy._utils.Clock(
+            {f"component{i}": td for i, td in enumerate(timedomains * 2)}
+        )
+        clock.set_dumping_frequency(dumping_frequency=self.dumping)
+
+        exp_bool = [self.exp_bool_a, self.exp_bool_b, self.exp_bool_c]
+        exp_bool += [self.exp_bool_d, self.exp_bool_e]
+        exp_bool = exp_bool * 2 + [self.exp_bool_g]
+
+        self.assertEqual([list(row) for row in zip(*clock)], exp_bool)
+
+    def test_clock_switch_rows_many_rows(self):
+        clock = unifhy._utils.Clock(
+            {
+                "surfacelayer": self.td_a,
+                "subsurface": self.td_b,
+                "openwater": self.td_c,
+                "nutrientsurfacelayer": self.td_d,
+                "nutrientsubsurface": self.td_e,
+                "nutrientopenwater": self.td_f,
+            },
+        )
+        clock.set_dumping_frequency(dumping_frequency=self.dumping)
+
+        # stack switches to more than 8 rows to go through the branch
+        # not encoding the switches of a step in one byte
+        matrix = np.vstack([clock._switch_matrix, ~clock._switch_matrix])
+        clock._switch_matrix = matrix
+        clock._set_switch_rows()
+
+        self.assertEqual(len(matrix), 14)
+        self.assertEqual(
+            [clock._switch_rows[code] for code in clock._switch_codes],
+            [tuple(column) for column in matrix.T.tolist()],
+        )
+
+    def test_clock_batch_invalid_size(self):
+        clock = unifhy._utils.Clock(
+            {
+                "surfacelayer": self.td_a,
+                "subsurface": self.td_b,
+                "openwater": self.td_c,
+                "nutrientsurfacelayer": self.td_d,
+                "nutrientsubsurface": self.td_e,
+                "nutrientopenwater": self.td_f,
+            },
+        )
+
+        with self.assertRaises(ValueError):
+            clock.batch(0)
+        with self.assertRaises(ValueError):
+            clock.batch(-1)
+        with self.assertRaises(TypeError):
+            clock.batch(2.5)
+        with self.assertRaises(TypeError):
+            clock.batch(True)
+
     @unittest.expectedFailure
     def test_clock_incompatible_timedomains(self):
         clock = unifhy._utils.Clock(
@@ -1,13 +1,179 @@
 import unittest
 import doctest
+import numpy as np
 
-import unifhy
+import unifhy._utils
+from ..test_time import get_dummy_timedomain
+from ..test_space import get_dummy_spacedomain
+
+
+class DummyComponent(object):
+    # minimal component exposing the information used by the Exchanger
+    def __init__(self, category, spacedomain, inwards_info, outwards_info):
+        self.category = category
+        self.spacedomain = spacedomain
+        self.inwards_info = inwards_info
+        self.outwards_info = outwards_info
+
+
+def get_dummy_exchanger(method):
+    # one source component sending the same transfer to three receiving
+    # components, one at the same temporal resolution as the source
+    # (history of one timestep) and two at coarser temporal resolutions
+    # (histories of two and four timesteps, respectively)
+    timedomains = {
+        "surfacelayer": get_dummy_timedomain("daily"),
+        "subsurface": get_dummy_timedomain("daily"),
+        "openwater": get_dummy_timedomain("2daily"),
+        "nutrientsurfacelayer": get_dummy_timedomain("4daily"),
+    }
+    spacedomain = get_dummy_spacedomain("1deg")
+    receivers = ["subsurface", "openwater", "nutrientsurfacelayer"]
+
+    components = {
+        "surfacelayer": DummyComponent(
+            "surfacelayer",
+            spacedomain,
+            {},
+            {"transfer_x": {"units": "1", "to": receivers, "method": method}},
+        )
+    }
+    for c in receivers:
+        components[c] = DummyComponent(
+            c,
+            spacedomain,
+            {
+                "transfer_x": {
+                    "units": "1",
+                    "from": "surfacelayer",
+                    "method": method,
+                }
+            },
+            {},
+        )
+
+    clock = unifhy._utils.Clock(timedomains)
+    compass = unifhy._utils.Compass({c: spacedomain for c in timedomains})
+
+    return unifhy._utils.Exchanger(components, clock, compass, "dummy", "outputs")
+
+
+class TestExchanger(unittest.TestCase):
+    receivers = ["subsurface", "openwater", "nutrientsurfacelayer"]
+
+    def test_exchanger_transfers_reductions(self):
+        rng = np.random.default_rng(42)
+
+        references = {
+            "mean": lambda history, weights, dst: np.average(
+                history, weights=weights, axis=0
+            ),
+            "sum": lambda history, weights, dst: np.sum(
+                history * (weights / dst)[:, np.newaxis, np.newaxis], axis=0
+            ),
+            "point": lambda history, weights, dst: history[-1],
+            "minimum": lambda history, weights, dst: np.amin(history, axis=0),
+            "maximum": lambda history, weights, dst: np.amax(history, axis=0),
+        }
+
+        for method, reference in references.items():
+            with self.subTest(method=method):
+                exchanger = get_dummy_exchanger(method)
+                clock = exchanger.clock
+                shape = exchanger.transfers["transfer_x"]["array"].shape[1:]
+                src = clock.increments["surfacelayer"]
+
+                # receivers with different histories share one buffer
+                # sized for the longest history (only the latest timestep
+                # is needed with method point), which starts with zeros
+                history = 1 if method == "point" else 4
+                self.assertEqual(exchanger.transfers["transfer_x"]["history"], history)
+                sent = [np.zeros(shape)] * history
+
+                for switches in clock:
+                    if switches[0]:
+                        sent.append(rng.random(shape))
+                        exchanger.set_transfer("transfer_x", sent[-1])
+                    for c, switch in zip(self.receivers, switches[1:]):
+                        if switch:
+                            dst = clock.increments[c]
+                            # (equal weights on the source timesteps
+                            #  covered by the receiver timestep)
+                            weights = np.full(max(dst // src, 1), min(src, dst))
+                            # compare with straightforward reduction over
+                            # the most recent timesteps in a list (after
+                            # the circular buffer wrapped around)
+                            np.testing.assert_allclose(
+                                exchanger.get_transfer("transfer_x", c),
+                                reference(
+                                    np.array(sent[-len(weights) :]), weights, dst
+                                ),
+                            )
+
+                # buffer must have wrapped around several times
+                self.assertGreater(len(sent) - history, 2 * history)
+
+    def test_exchanger_reduction_dispatch(self):
+        expected = {
+            "mean": "_reduce_weighted",
+            "sum": "_reduce_weighted",
+            "point": "_reduce_point",
+            "minimum": "_reduce_minimum",
+            "maximum": "_reduce_maximum",
+        }
+        for method, reduction in expected.items():
+            exchanger = get_dummy_exchanger(method)
+            self.assertEqual(
+                exchanger.transfers["transfer_x"]["reduce"].__name__, reduction
+            )
+
+        # time weights of receivers with a shorter history are padded
+        # with zeros on the oldest timesteps to apply to the whole buffer
+        exchanger = get_dummy_exchanger("mean")
+        t_weights = exchanger.transfers["transfer_x"]["openwater"]["t_weights"]
+        np.testing.assert_array_equal(t_weights[0], [0, 0, 0.5, 0.5])
+
+        with self.assertRaises(ValueError):
+            get_dummy_exchanger("median")
+
+    def test_exchanger_inwards_kept_across_steps(self):
+        rng = np.random.default_rng(42)
+
+        for method in ["mean", "sum", "minimum", "maximum"]:
+            with self.subTest(method=method):
+                exchanger = get_dummy_exchanger(method)
+                shape = exchanger.transfers["transfer_x"]["array"].shape[1:]
+
+                kept = {c: [] for c in self.receivers}
+                for switches in exchanger.clock:
+                    if switches[0]:
+                        latest = rng.random(shape)
+                        exchanger.set_transfer("transfer_x", latest)
+                    for c, switch in zip(self.receivers, switches[1:]):
+                        if switch:
+                            value = exchanger.get_transfer("transfer_x", c)
+                            # modify the inward in place (as a component
+                            # may do) and keep it beyond the current step
+                            value += 1
+                            kept[c].append((value, value.copy()))
+                            # stored transfer must not be affected
+                            np.testing.assert_array_equal(
+                                exchanger.get_latest_transfer("transfer_x"),
+                                latest,
+                            )
+
+                # inwards kept must not be overwritten at later steps
+                for c in self.receivers:
+                    self.assertGreater(len(kept[c]), 1)
+                    for value, expected in kept[c]:
+                        np.testing.assert_array_equal(value, expected)
 
 
 if __name__ == "__main__":
     test_loader = unittest.TestLoader()
     test_suite = unittest.TestSuite()
 
+    test_suite.addTests(test_loader.loadTestsFromTestCase(TestExchanger))
     test_suite.addTests(doctest.DocTestSuite(unifhy._utils.exchanger))
 
     runner = unittest.TextTestRunner(verbosity=2)
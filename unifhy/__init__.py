@@ -1,20 +1,56 @@
 """A Community Model for the Terrestrial Water Cycle."""
+from importlib import import_module
 
-
-# import package's own modules, classes, functions
+# import package's own lightweight modules, classes, functions
 from .version import __version__
-from .model import Model
-from .time import TimeDomain
-from .space import LatLonGrid, RotatedLatLonGrid, BritishNationalGrid
-from .data import DataSet
-from .component import (
-    SurfaceLayerComponent,
-    SubSurfaceComponent,
-    OpenWaterComponent,
-    NutrientSurfaceLayerComponent,
-    NutrientSubSurfaceComponent,
-    NutrientOpenWaterComponent,
-    DataComponent,
-    NullComponent,
-)
 from .settings import atol, rtol, decr, dtype_float
+
+# map package's public classes to the module they are defined in,
+# these modules are only imported when one of their classes is first
+# accessed (PEP 562) so that importing the package does not drag in
+# the whole framework and its dependencies
+_lazy_attributes = {
+    "Model": "model",
+    "TimeDomain": "time",
+    "LatLonGrid": "space",
+    "RotatedLatLonGrid": "space",
+    "BritishNationalGrid": "space",
+    "DataSet": "data",
+    "SurfaceLayerComponent": "component",
+    "SubSurfaceComponent": "component",
+    "OpenWaterComponent": "component",
+    "NutrientSurfaceLayerComponent": "component",
+    "NutrientSubSurfaceComponent": "component",
+    "NutrientOpenWaterComponent": "component",
+    "DataComponent": "component",
+    "NullComponent": "component",
+}
+
+_lazy_submodules = {"model", "time", "space", "data", "component", "_utils"}
+
+__all__ = [
+    "__version__",
+    *_lazy_attributes,
+    "atol",
+    "rtol",
+    "decr",
+    "dtype_float",
+]
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        module = import_module(f".{_lazy_attributes[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _lazy_submodules:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache in module namespace so that __getattr__ is not called again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _lazy_submodules)
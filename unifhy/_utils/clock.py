@@ -1,16 +1,16 @@
 import numpy as np
 from datetime import timedelta
+import operator
 from cftime import date2num
-from math import gcd
-from itertools import combinations
 
 from ..time import TimeDomain
 
 
 class Clock(object):
     def __init__(self, timedomains):
+        # (timedomains are not kept because only their resolution is
+        #  needed after set up, which is stored as increments below)
         self.categories = tuple(timedomains)
-        self.timedomains = timedomains
         # check time compatibility between components
         (
             supermesh_delta,
@@ -19,23 +19,40 @@ class Clock(object):
         ) = self._check_timedomain_compatibilities(timedomains)
 
         # get boolean arrays (switches) to determine when to run a given
-        # component on temporal supermesh
-        self.switches = {}
-        self.increments = {}
+        # component on temporal supermesh, all stored in one contiguous
+        # array with one row per component (and a last row for dumping)
+        self._switch_matrix = np.zeros(
+            (len(self.categories) + 1, supermesh_length), dtype=bool
+        )
+        # keep access to the switches by category via views on the array
+        self.switches = {
+            cat: self._switch_matrix[k] for k, cat in enumerate(self.categories)
+        }
+        self.switches["dumping"] = self._switch_matrix[-1]
 
-        steps = {c: timedomains[c].timedelta.total_seconds() for c in self.categories}
+        # determine how many supermesh steps each component covers
+        # (all at once rather than one component at a time)
+        steps = np.array(
+            [timedomains[c].timedelta.total_seconds() for c in self.categories]
+        )
+        increments = (steps // supermesh_step).astype(int).tolist()
+        self.increments = dict(zip(self.categories, increments))
 
-        for category in timedomains:
-            self.switches[category] = np.zeros((supermesh_length,), dtype=bool)
-            increment = int(steps[category] // supermesh_step)
-            self.switches[category][increment - 1 :: increment] = True
-            self.increments[category] = increment
+        # only the strided assignment remains per component
+        # (because the stride differs from one component to the next)
+        for k, increment in enumerate(increments):
+            self._switch_matrix[k, increment - 1 :: increment] = True
 
         # determine model states minimum dumping delta and set initial dump
-        self.switches["dumping"] = np.zeros((supermesh_length,), dtype=bool)
-        self.min_dumping_step = max(steps.values())
+        self.min_dumping_step = steps.max().item()
         # set as a minimum requirement one dump for the initial conditions
-        self.switches["dumping"][0] = True
+        self._switch_matrix[-1, 0] = True
+
+        # gather switches for each step of supermesh in a tuple ahead
+        # of the iteration to avoid building it at each step
+        self._switch_codes = None
+        self._switch_rows = None
+        self._set_switch_rows()
 
         # generate a TimeDomain for the Clock
         start_datetime = timedomains[self.categories[0]].bounds.datetime_array[0, 0]
@@ -51,10 +68,12 @@ class Clock(object):
         self.start_timeindex = 0
         self.end_timeindex = supermesh_length - 1
 
-        # initialise 'iterable' time attributes to the point in time just
+        # initialise 'iterable' time attribute to the point in time just
         # prior the actual specified start of the supermesh because the
         # iterator needs to increment in time prior indexing the switches
-        self._current_datetime = start_datetime - supermesh_delta
+        # (the current datetime is only derived from the current index
+        #  when requested rather than incremented at each step)
+        self._start_datetime = start_datetime
         self._current_timeindex = self.start_timeindex - 1
 
     @staticmethod
@@ -108,25 +127,26 @@ class Clock(object):
             ...
         ValueError: timedomains of components openwater and subsurface are not integer multiple of one another
         """
-        # checks on each pair of components
-        for c1, c2 in combinations(timedomains, 2):
-            # check that components' timedomains start/end on same datetime
+        # get each component's resolution in seconds once and for all
+        seconds = {c: td.timedelta.total_seconds() for c, td in timedomains.items()}
+
+        # check that components' timedomains start/end on same datetime
+        # (spanning same period being transitive, checking each component
+        #  against the first one is enough rather than checking each pair)
+        c1, *others = timedomains
+        for c2 in others:
             if not timedomains[c1].spans_same_period_as(timedomains[c2]):
                 raise ValueError(
                     f"timedomains of components {c1} and {c2} "
                     f"do not span same period"
                 )
 
-            # check that components' resolutions are integer multiples
-            if timedomains[c1].timedelta < timedomains[c2].timedelta:
-                c1, c2 = c2, c1
-            if (
-                not (
-                    timedomains[c1].timedelta.total_seconds()
-                    % timedomains[c2].timedelta.total_seconds()
-                )
-                == 0
-            ):
+        # check that components' resolutions are integer multiples
+        # (this being transitive too, checking each component against
+        #  the next finer one is enough)
+        ordered = sorted(seconds, key=seconds.get)
+        for c2, c1 in zip(ordered[:-1], ordered[1:]):
+            if not seconds[c1] % seconds[c2] == 0:
                 raise ValueError(
                     f"timedomains of components {c1} and {c2} "
                     f"are not integer multiple of one another"
@@ -134,19 +154,12 @@ class Clock(object):
 
         # determine temporal supermesh properties
         # (supermesh is the fastest component)
-        delta = min(*[timedomains[cat].timedelta for cat in timedomains])
-        length = max(*[timedomains[cat].time.size for cat in timedomains])
-        step = delta.total_seconds()
+        delta = min(td.timedelta for td in timedomains.values())
+        length = max(td.time.size for td in timedomains.values())
+        step = min(seconds.values())
 
         return delta, length, step
 
-    @staticmethod
-    def _lcm_timedelta(timedelta_a, timedelta_b):
-        a = int(timedelta_a.total_seconds())
-        b = int(timedelta_b.total_seconds())
-        lcm = a * b // gcd(a, b)
-        return timedelta(seconds=lcm)
-
     def set_dumping_frequency(self, dumping_frequency):
         # check that dumpy frequency is a multiple of dumping delta
         dumping_step = dumping_frequency.total_seconds()
@@ -162,12 +175,45 @@ class Clock(object):
         dumping_increment = int(dumping_step // self.timedelta.total_seconds())
         self.switches["dumping"][0::dumping_increment] = True
 
+        # dumping switches changed, so switch rows need updating
+        self._set_switch_rows()
+
+    def _set_switch_rows(self):
+        # rather than storing a tuple for each step of the supermesh,
+        # store one small integer code per step used to look up the
+        # tuple for its combination of switches, to limit the memory
+        # footprint of the table for long simulations
+        rows = len(self._switch_matrix)
+        if rows <= 8:
+            # with up to 8 rows, the code of a step is the integer whose
+            # bits are its switches, stored in one byte per step, and all
+            # 2**rows combinations of switches are tabulated
+            codes = (1 << np.arange(rows)) @ self._switch_matrix
+            self._switch_codes = codes.astype(np.uint8).tobytes()
+            self._switch_rows = [
+                tuple(bool(code >> k & 1) for k in range(rows))
+                for code in range(1 << rows)
+            ]
+        else:
+            # with more rows, the switches of a step do not fit in one
+            # byte (and tabulating all combinations would grow as
+            # 2**rows), so only the combinations actually occurring are
+            # tabulated, and the code of a step is the position of its
+            # combination among them (i.e. the inverse from np.unique)
+            columns, inverse = np.unique(
+                self._switch_matrix, axis=1, return_inverse=True
+            )
+            self._switch_codes = memoryview(inverse.ravel().astype(np.intp))
+            self._switch_rows = [tuple(column) for column in columns.T.tolist()]
+
     def get_current_datetime(self):
-        return self._current_datetime
+        return self._start_datetime + self._current_timeindex * self.timedelta
 
     def get_current_timestamp(self):
         return date2num(
-            self._current_datetime, self.timedomain.units, self.timedomain.calendar
+            self.get_current_datetime(),
+            self.timedomain.units,
+            self.timedomain.calendar,
         )
 
     def get_current_timeindex(self, category):
@@ -176,17 +222,45 @@ class Clock(object):
     def __iter__(self):
         return self
 
+    def batch(self, size):
+        # iterate over chunks of (at most) 'size' contiguous steps of the
+        # supermesh at once, yielding read-only views on the switches with
+        # one row per component (and a last row for dumping) and one column
+        # per step, the clock being left on the last step of the chunk
+        # (size is checked here rather than in the generator so that the
+        #  error is raised on call and not on first iteration)
+        if isinstance(size, bool):
+            raise TypeError(f"batch size ({size!r}) must be a positive integer")
+        try:
+            size = operator.index(size)
+        except TypeError:
+            raise TypeError(f"batch size ({size!r}) must be a positive integer")
+        if size < 1:
+            raise ValueError(f"batch size ({size!r}) must be a positive integer")
+
+        return self._iter_batches(size)
+
+    def _iter_batches(self, size):
+        while self._current_timeindex < self.end_timeindex:
+            start = self._current_timeindex + 1
+            stop = min(start + size, self.end_timeindex + 1)
+
+            self._current_timeindex = stop - 1
+
+            # (read-only to keep switches consistent with the step codes
+            #  used when iterating one step at a time)
+            chunk = self._switch_matrix[:, start:stop]
+            chunk.flags.writeable = False
+
+            yield chunk
+
     def __next__(self):
         # loop until it hits to last index (because the last index
         # corresponds to the start of the last timestep)
-        if self._current_timeindex < self.end_timeindex:
-            self._current_timeindex += 1
-            index = self._current_timeindex
-            self._current_datetime += self.timedelta
-
-            return (
-                *(self.switches[cat][index] for cat in self.categories),
-                self.switches["dumping"][index],
-            )
-        else:
+        index = self._current_timeindex + 1
+        if index > self.end_timeindex:
             raise StopIteration
+
+        self._current_timeindex = index
+
+        return self._switch_rows[self._switch_codes[index]]
@@ -37,6 +37,10 @@ class Compass(object):
         ...     {'surfacelayer': sd_sl, 'subsurface': sd_ss, 'openwater': sd_ow}
         ... )
         {('surfacelayer', 'subsurface'): 'subsurface', ('surfacelayer', 'openwater'): 'openwater', ('subsurface', 'openwater'): 'openwater'}
+        >>> Compass._check_spacedomain_compatibilities(
+        ...     {'surfacelayer': sd_ss, 'subsurface': sd_ss, 'openwater': sd_ss}
+        ... )
+        {('surfacelayer', 'subsurface'): 'subsurface', ('surfacelayer', 'openwater'): 'openwater', ('subsurface', 'openwater'): 'openwater'}
 
         >>> sd_sl = LatLonGrid(
         ...     longitude=[0, 20],
@@ -97,6 +101,13 @@ class Compass(object):
 
         # checks on each pair of components
         for c1, c2 in combinations(spacedomains, 2):
+            # skip the (expensive) comparisons if components share the
+            # same spacedomain object, which spans the same region as,
+            # and is matched in, itself
+            if spacedomains[c1] is spacedomains[c2]:
+                supermeshes[(c1, c2)] = c2
+                continue
+
             # check that components' spacedomains are equal
             # (to stay until spatial supermesh supported)
             if not spacedomains[c1].spans_same_region_as(spacedomains[c2]):
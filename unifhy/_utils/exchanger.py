@@ -1,6 +1,7 @@
 from os import path, sep
 from netCDF4 import Dataset
 from datetime import datetime
+from functools import lru_cache
 import cftime
 import numpy as np
 
@@ -12,13 +13,12 @@ class Exchanger(object):
         # transfers that are both inwards and outwards will exist
         # only once because dictionary keys are unique
         transfers = {}
-        for c in components:
-            for i in [components[c].inwards_info, components[c].outwards_info]:
-                for t in i:
-                    if t not in transfers:
-                        transfers[t] = {}
-                    transfers[t].update(i[t])
-                    if "to" in i[t]:
+        for component in components.values():
+            for i in (component.inwards_info, component.outwards_info):
+                for t, info in i.items():
+                    transfer = transfers.setdefault(t, {})
+                    transfer.update(info)
+                    if "to" in info:
                         # store component category for dumping (which
                         # will be identical to 'from' in most cases, but
                         # when 'from' is absent, source component still
@@ -26,9 +26,9 @@ class Exchanger(object):
                         # right netcdf group, and absence of 'from' is
                         # informative, so info should not be added under
                         # 'from', but using a different key)
-                        transfers[t]["src_cat"] = components[c].category
+                        transfer["src_cat"] = component.category
                         # store component spacedomain for remapping
-                        transfers[t]["src_sd"] = components[c].spacedomain
+                        transfer["src_sd"] = component.spacedomain
 
         self.transfers = transfers
         # set up transfers according to components' time-/spacedomains
@@ -42,6 +42,7 @@ class Exchanger(object):
         # directories and files
         self.saving_directory = saving_directory
         self.dump_file = None
+        self._dump_path = None
 
     def set_up(self, clock, compass, overwrite=False):
         # (re)assign clock and compass to exchanger
@@ -50,10 +51,7 @@ class Exchanger(object):
 
         # determine how many iterations of the clock
         # each component covers (i.e. steps)
-        steps = {
-            c: clock.timedomains[c].timedelta // clock.timedelta
-            for c in clock.timedomains
-        }
+        steps = clock.increments
 
         # set up each transfer
         for t in self.transfers:
@@ -76,9 +74,18 @@ class Exchanger(object):
                 # no component is going to call get_transfer, so no need
                 # for time weights, but because transfers still need to be
                 # stored for dump, need to define 'history' for creation
-                # of 'array' and 'slices'
+                # of 'array'
                 histories.append(1)
             else:
+                # select the function reducing the stored timesteps
+                # into the value given to the receiving components
+                try:
+                    self.transfers[t]["reduce"] = _reductions[
+                        self.transfers[t]["method"]
+                    ]
+                except KeyError:
+                    raise ValueError("method for exchanger transfer unknown")
+
                 src_ts = steps[self.transfers[t]["from"]]
                 for c in self.transfers[t]["to"]:
                     dst_ts = steps[c]
@@ -111,28 +118,64 @@ class Exchanger(object):
                         )
                         self.transfers[t][c]["remap"] = (src_fld, remap)
 
-                    # determine the time weights that will be used by the
-                    # exchanger on the stored timesteps when a transfer
-                    # is asked (i.e. when get_transfer is called)
-                    t_weights = self._calculate_temporal_weights(
-                        src_ts, dst_ts, clock.length
-                    )
+                    # only the latest timestep is ever read if method is
+                    # point, or if source step is a multiple of destination
+                    # step (i.e. the latest timestep gets the whole weight),
+                    # so no need to compute the time weights in this case,
+                    # nor to store the older timesteps
+                    if self.transfers[t]["method"] == "point" or src_ts % dst_ts == 0:
+                        history = 1
+                        # trivial weights, only there for the iteration
+                        # (broadcast from a single value, so no memory used)
+                        t_weights = np.broadcast_to(
+                            np.ones(1, dtype_float()), (clock.length // dst_ts, 1)
+                        )
+                    else:
+                        # determine the time weights that will be used by the
+                        # exchanger on the stored timesteps when a transfer
+                        # is asked (i.e. when get_transfer is called)
+                        t_weights = self._calculate_temporal_weights(
+                            src_ts, dst_ts, clock.length
+                        )
+
+                        # history is the number of timesteps that are stored
+                        history = t_weights.shape[-1]
+
+                        # special case if method is mean
+                        if self.transfers[t]["method"] == "mean":
+                            # normalise time weights once and for all so that
+                            # the weighted mean is a simple dot product
+                            t_weights = t_weights / t_weights.sum(
+                                axis=-1, keepdims=True
+                            )
+                        # special case if method is sum
+                        elif self.transfers[t]["method"] == "sum":
+                            # time weights need to sum to one
+                            # (no need to add dimensions of size 1 for numpy
+                            #  broadcasting because weighted sum is computed
+                            #  on flattened space dimensions)
+                            t_weights = t_weights / dst_ts
+
+                        # convert time weights once and for all to the same
+                        # floating point type as the stored transfers to
+                        # avoid type promotion every time they are applied
+                        t_weights = np.ascontiguousarray(t_weights, dtype=dtype_float())
+
+                    # preallocate buffer receiving the value reduced over
+                    # the stored timesteps to avoid allocating a new array
+                    # each time a transfer is asked, only if this value is
+                    # remapped before being given to the receiving component
+                    # (remapping returns a new array, so the buffer never
+                    #  reaches the component, which must otherwise be given
+                    #  a new array it can keep or modify)
+                    if (
+                        self.transfers[t][c]["remap"] is not None
+                        and self.transfers[t]["method"] != "point"
+                    ):
+                        self.transfers[t][c]["out"] = np.empty(shape, dtype_float())
 
-                    # history is the number of timesteps that are stored
-                    history = t_weights.shape[-1]
                     self.transfers[t][c]["history"] = history
                     histories.append(history)
-
-                    # special case if method is sum
-                    if self.transfers[t]["method"] == "sum":
-                        # time weights need to sum to one
-                        t_weights = t_weights / dst_ts
-                        # need to add dimensions of size 1 for numpy
-                        # broadcasting in weighted sum
-                        t_weights = np.expand_dims(
-                            t_weights, axis=[-(i + 1) for i in range(len(shape))]
-                        )
-
                     self.transfers[t][c]["t_weights"] = t_weights
 
                     # initialise iterator that allows the exchanger to know
@@ -143,6 +186,20 @@ class Exchanger(object):
             history = max(histories)
             self.transfers[t]["history"] = history
 
+            # pad the time weights of the receiving components requiring
+            # less history than stored with zero weights on the oldest
+            # timesteps, so that they apply to the whole stored array
+            # (unless they only read the latest timestep, in which case
+            #  the time weights are not applied)
+            if self.transfers[t].get("from") is not None:
+                for c in self.transfers[t]["to"]:
+                    t_weights = self.transfers[t][c]["t_weights"]
+                    missing = history - self.transfers[t][c]["history"]
+                    if missing and self.transfers[t][c]["history"] > 1:
+                        self.transfers[t][c]["t_weights"] = np.pad(
+                            t_weights, [(0, 0), (missing, 0)]
+                        )
+
             # if required or requested, initialise array to store
             # required timesteps
             if (
@@ -153,11 +210,12 @@ class Exchanger(object):
                     and (self.transfers[t]["array"].shape != ((history,) + shape))
                 )
             ):
-                arr = np.zeros((history,) + shape, dtype_float())
-                self.transfers[t]["array"] = arr
-                # set up slices that are views of the array that is
-                # to be rolled around each time a transfer is asked
-                self.transfers[t]["slices"] = [arr[i] for i in range(history)]
+                # array is used as a circular buffer along its first
+                # dimension, where 'head' is the index of the timestep
+                # to be overwritten by the next incoming value (i.e. the
+                # oldest value stored)
+                self.transfers[t]["array"] = np.zeros((history,) + shape, dtype_float())
+                self.transfers[t]["head"] = 0
 
     @staticmethod
     def _calculate_temporal_weights(src, dst, length):
@@ -188,67 +246,37 @@ class Exchanger(object):
                [0, 3],
                [0, 3]])
         """
-        weights = []
-
-        if dst == src:
-            # need to keep only one step with full weight
-            keep = 1
-            for i in range(length // dst):
-                weights.append((dst,))
-        elif dst > src:
-            if dst % src == 0:
-                # need to keep several steps with equal weights
-                keep = dst // src
-                for i in range(length // dst):
-                    weights.append((src,) * (dst // src))
-            else:
-                # need to keep several steps with varying weights
-                keep = (dst // src) + 1
-                previous = 0
-                for i in range(length // dst):
-                    start = src - previous
-                    middle = (dst - start) // src
-                    end = dst - start - (middle * src)
-                    weights.append(
-                        (start, *((src,) * middle), *((end,) if end > 0 else ()))
-                    )
-                    previous = end
+        # start of each step of the destination component
+        # (all steps covered at once rather than one at a time)
+        starts = np.arange(length // dst) * dst
+
+        if dst < src and src % dst:
+            # need to keep two steps with varying weights
+            keep = 2
+            # first source boundary strictly after start of destination step
+            boundaries = (starts // src + 1) * src
+            # check whether this boundary falls in-between two consecutive
+            # steps of destination
+            in_between = boundaries < starts + dst
+            # if so, spread weight across source kept values,
+            # if not (i.e. source coincides with or is beyond destination
+            # next step), put whole weight on source latest value
+            oldest = np.where(in_between, boundaries - starts, 0)
+            weights = np.stack([oldest, dst - oldest], axis=-1)
         else:
-            if src % dst == 0:
-                # need to keep only one step with full weight
-                keep = 1
-                for i in range(length // dst):
-                    weights.append((dst,))
-            else:
-                # need to keep two steps with varying weights
-                keep = 2
-                src_hits = 1
-                for i in range(length // dst):
-                    src_tracker = src * src_hits
-                    if ((i * dst) < src_tracker) and (src_tracker < ((i + 1) * dst)):
-                        # src falls in-between two consecutive steps of dst
-                        # spread weight across src kept values
-                        # and update src hits
-                        discard = (src_tracker // dst) * dst
-                        oldest = src_tracker - discard
-                        latest_ = dst - oldest
-                        weights.append((oldest, latest_))
-                        src_hits += 1
-                    elif (i * dst) == src_tracker:
-                        # src coincides with dst
-                        # put whole weight on src latest value
-                        # and update dst hits
-                        weights.append((0, dst))
-                        src_hits += 1
-                    else:
-                        # src is beyond dst and dst's next step
-                        # put whole weight on src latest value
-                        # but do not update src hits
-                        weights.append((0, dst))
-
-        weights = np.array(weights)
-
-        assert keep == weights.shape[-1], "error in exchanger temporal weights"
+            # need to keep one or several steps, the weight of each being
+            # the overlap between a source step and the destination step
+            # (full weight on one step if source is a multiple of
+            # destination, equal weights if destination is a multiple of
+            # source, varying weights otherwise)
+            keep = -(-dst // src) if dst > src else 1
+            sources = (starts // src)[:, np.newaxis] + np.arange(keep)
+            weights = np.minimum((sources + 1) * src, (starts + dst)[:, np.newaxis])
+            weights = weights - np.maximum(sources * src, starts[:, np.newaxis])
+
+        assert (
+            keep == weights.shape[-1] and (weights.sum(axis=-1) == dst).all()
+        ), "error in exchanger temporal weights"
 
         return weights
 
@@ -256,64 +284,54 @@ class Exchanger(object):
         self.dump_file = "_".join(
             [self.identifier, "exchanger", tag, "dump_transfers.nc"]
         )
-        if overwrite or not path.exists(
-            sep.join([self.saving_directory, self.dump_file])
-        ):
+        # build path to dump file once for all the dumps to come
+        self._dump_path = sep.join([self.saving_directory, self.dump_file])
+        if overwrite or not path.exists(self._dump_path):
             create_transfers_dump(
-                sep.join([self.saving_directory, self.dump_file]),
+                self._dump_path,
                 self.transfers,
                 self.clock.timedomain,
                 self.compass.spacedomains,
             )
 
     def dump_transfers(self, timestamp):
-        update_transfers_dump(
-            sep.join([self.saving_directory, self.dump_file]), self.transfers, timestamp
-        )
+        update_transfers_dump(self._dump_path, self.transfers, timestamp)
 
     def finalise_(self):
         timestamp = self.clock.timedomain.bounds.array[-1, -1]
-        update_transfers_dump(
-            sep.join([self.saving_directory, self.dump_file]), self.transfers, timestamp
-        )
+        update_transfers_dump(self._dump_path, self.transfers, timestamp)
+
+    def get_latest_transfer(self, name):
+        # the most recent value is just behind the head of the buffer
+        return self.transfers[name]["array"][self.transfers[name]["head"] - 1]
 
     def get_transfer(self, name, component):
-        i = self.transfers[name][component]["iter"]
-        history = self.transfers[name][component]["history"]
+        transfer = self.transfers[name]
+        receiver = transfer[component]
+        i = receiver["iter"]
 
         # customise the action between existing and incoming arrays
-        # depending on method for that particular transfer
-        if self.transfers[name]["method"] == "mean":
-            value = np.average(
-                self.transfers[name]["slices"][-history:],
-                weights=self.transfers[name][component]["t_weights"][i],
-                axis=0,
-            )
-        elif self.transfers[name]["method"] == "sum":
-            value = np.sum(
-                self.transfers[name]["slices"][-history:]
-                * self.transfers[name][component]["t_weights"][i],
-                axis=0,
-            )
-        elif self.transfers[name]["method"] == "point":
-            value = self.transfers[name]["slices"][-1]
-        elif self.transfers[name]["method"] == "minimum":
-            value = np.amin(self.transfers[name]["slices"][-history:], axis=0)
-        elif self.transfers[name]["method"] == "maximum":
-            value = np.amax(self.transfers[name]["slices"][-history:], axis=0)
-        else:
-            raise ValueError("method for exchanger transfer unknown")
+        # depending on method for that particular transfer (using the
+        # reduction function selected at set up for this method, with
+        # a buffer to reduce into only if the value is to be remapped)
+        value = transfer["reduce"](
+            transfer["array"],
+            transfer["head"],
+            receiver["t_weights"][i],
+            receiver["history"],
+            receiver.get("out"),
+        )
 
         # TODO: remap value from supermesh resolution to destination resolution
         # REPLACED BY:
         # remap value from source resolution to destination resolution
-        if self.transfers[name][component]["remap"] is not None:
-            src, remap = self.transfers[name][component]["remap"]
+        if receiver["remap"] is not None:
+            src, remap = receiver["remap"]
             src[:] = value
             value = src.regrids(remap).array
 
         # record that another value was retrieved by incrementing count
-        self.transfers[name][component]["iter"] += 1
+        receiver["iter"] = i + 1
 
         # convert value to masked array if mask exists
         mask = self.compass.spacedomains[component].land_sea_mask
@@ -325,22 +343,108 @@ class Exchanger(object):
     def set_transfer(self, name, array):
         # TODO: remap value from source resolution to supermesh resolution
 
-        # make room for new value by time incrementing
-        lhs = [a for a in self.transfers[name]["slices"]]
-        rhs = [a for a in self.transfers[name]["slices"][1:]] + [
-            self.transfers[name]["slices"][0]
-        ]
-
-        lhs[:] = rhs[:]
-
-        self.transfers[name]["slices"][:] = lhs
-        self.transfers[name]["slices"][-1][:] = array
+        # overwrite oldest value with new value and move head of
+        # circular buffer forward (rather than rolling the array)
+        transfer = self.transfers[name]
+        head = transfer["head"]
+        transfer["array"][head] = array
+        transfer["head"] = (head + 1) % transfer["history"]
 
     def update_transfers(self, transfers):
         for name, array in transfers.items():
             self.set_transfer(name, array)
 
 
+def _weighted_sum(weights, array, out):
+    # flatten the space dimensions so that the weighted sum along
+    # the time dimension is a matrix-vector product computed in a
+    # single pass over the array (without temporary array) by BLAS
+    value = np.dot(
+        weights,
+        array.reshape(len(array), -1),
+        out=None if out is None else out.reshape(-1),
+    )
+    return value.reshape(array.shape[1:])
+
+
+def _get_latest(array, head, out):
+    # return a copy of the most recent timestep (just behind the head of
+    # the buffer) so that the stored timestep cannot be altered by the
+    # receiving component (copied into out if given)
+    if out is None:
+        return array[head - 1].copy()
+    np.copyto(out, array[head - 1])
+    return out
+
+
+@lru_cache(maxsize=None)
+def _ring_order(length, head):
+    # return the indices mapping the chronological order (i.e. from the
+    # oldest to the most recent) onto the positions in a circular buffer
+    # of given length whose oldest value is at head (cached because only
+    # a handful of combinations exist and np.roll is comparatively slow,
+    # and read-only because the cached array is shared by all callers)
+    order = np.roll(np.arange(length), head)
+    order.flags.writeable = False
+    return order
+
+
+def _get_history(array, head, history):
+    # return the given number of most recent timesteps stored in the
+    # array, which is the whole array if history is the maximum, or a
+    # contiguous view on the array if these timesteps do not wrap around
+    # the end of the circular buffer (only copied otherwise)
+    if history == len(array):
+        return array
+    if head >= history:
+        return array[head - history : head]
+    return array.take(range(head - history, head), axis=0, mode="wrap")
+
+
+# reduction functions for each method, all taking the array storing the
+# timesteps as a circular buffer, the position of its head, the time
+# weights for this step, the history required, and the output buffer
+# (None to return a new array)
+# (time weights are in chronological order, so they need to be rolled
+#  to match the position of the timesteps in the array)
+def _reduce_weighted(array, head, weights, history, out):
+    if history == 1:
+        # a single timestep gets the whole weight, so the weighted sum
+        # is the timestep itself
+        return _get_latest(array, head, out)
+    # time weights already normalised at set up for both mean and sum
+    # methods, so both reduce to a weighted sum along the time dimension
+    return _weighted_sum(weights[_ring_order(len(array), head)], array, out)
+
+
+def _reduce_point(array, head, weights, history, out):
+    # the most recent value is just behind the head of the buffer
+    return array[head - 1]
+
+
+def _reduce_minimum(array, head, weights, history, out):
+    if history == 1:
+        # the extremum over a single timestep is the timestep itself
+        return _get_latest(array, head, out)
+    return np.minimum.reduce(_get_history(array, head, history), axis=0, out=out)
+
+
+def _reduce_maximum(array, head, weights, history, out):
+    if history == 1:
+        # the extremum over a single timestep is the timestep itself
+        return _get_latest(array, head, out)
+    return np.maximum.reduce(_get_history(array, head, history), axis=0, out=out)
+
+
+_reductions = {
+    "mean": _reduce_weighted,
+    "sum": _reduce_weighted,
+    "point": _reduce_point,
+    "minimum": _reduce_minimum,
+    "maximum": _reduce_maximum,
+}
+
+
 def create_transfers_dump(filepath, transfers_info, timedomain, spacedomains):
     with Dataset(filepath, "w") as f:
         # description
@@ -372,11 +476,12 @@ def create_transfers_dump(filepath, transfers_info, timedomain, spacedomains):
             )
 
             # dimensions and coordinate variables
+            field = spacedomain.to_field()
             for axis in axes:
+                coord = field.dim(axis)
                 # dimension (domain axis)
-                g.createDimension(axis, len(getattr(spacedomain, axis)))
+                g.createDimension(axis, coord.size)
                 # variables (dimension coordinates)
-                coord = spacedomain.to_field().dim(axis)
                 a = g.createVariable(axis, dtype_float(), (axis,))
                 a.standard_name = coord.standard_name
                 a.units = coord.units
@@ -389,29 +494,41 @@ def create_transfers_dump(filepath, transfers_info, timedomain, spacedomains):
 
         # transfer variables
         for trf in transfers_info:
-            s = f.groups[transfers_info[trf]["src_cat"]].createVariable(
-                trf, dtype_float(), ("time", *axes)
-            )
+            g = f.groups[transfers_info[trf]["src_cat"]]
+            # (dimensions of the group are the axes of the source component)
+            dims = ("time", *g.dimensions)
+
+            # align chunks with the write pattern of the dump updates,
+            # i.e. whole transfer for a single time
+            chunks = (1, *(len(g.dimensions[dim]) for dim in dims[1:]))
+
+            s = g.createVariable(trf, dtype_float(), dims, chunksizes=chunks)
             s.standard_name = trf
             s.units = transfers_info[trf]["units"]
 
 
 def update_transfers_dump(filepath, transfers, timestamp):
     with Dataset(filepath, "a") as f:
-        try:
-            # check whether given snapshot already in file
-            t = cftime.time2index(timestamp, f.variables["time"])
-        # will get a IndexError if time variable is empty
-        # will get a ValueError if timestamp not in time variable
-        except (IndexError, ValueError):
-            # if not, extend time dimension
-            t = len(f.variables["time"])
-            f.variables["time"][t] = timestamp
-
-        for trf in transfers:
-            f.groups[transfers[trf]["src_cat"]].variables[trf][t, ...] = transfers[trf][
-                "slices"
-            ][-1]
+        time_ = f.variables["time"]
+        t = len(time_)
+        if t == 0 or timestamp > time_[-1]:
+            # snapshot is after the last one in file (most common case),
+            # so extend time dimension straight away
+            time_[t] = timestamp
+        else:
+            try:
+                # check whether given snapshot already in file
+                t = cftime.time2index(timestamp, time_)
+            # will get a ValueError if timestamp not in time variable
+            except ValueError:
+                # if not, extend time dimension
+                time_[t] = timestamp
+
+        for trf, transfer in transfers.items():
+            # most recent value is just behind head of circular buffer
+            f.groups[transfer["src_cat"]].variables[trf][t, ...] = transfer["array"][
+                transfer["head"] - 1
+            ]
 
 
 def load_transfers_dump(filepath, datetime_, transfers_info):
@@ -435,13 +552,11 @@ def load_transfers_dump(filepath, datetime_, transfers_info):
             except ValueError:
                 raise ValueError(f"{datetime_} not available in dump {filepath}")
 
-        # try to get each of the transfers, if not in file, carry on anyway
+        # get each of the transfers, if not in file, carry on anyway
+        groups = f.groups
         for trf in transfers_info:
-            try:
-                transfers[trf] = f.groups[transfers_info[trf]["src_cat"]].variables[
-                    trf
-                ][t, ...]
-            except KeyError:
-                pass
+            group = groups.get(transfers_info[trf]["src_cat"])
+            if group is not None and trf in group.variables:
+                transfers[trf] = group.variables[trf][t, ...]
 
     return transfers, datetime_
@@ -269,15 +269,16 @@ class RecordStream(object):
 
         with Dataset(self.file, "w") as f:
             axes = self._spacedomain.axes
+            field = self._spacedomain.to_field()
             # dimension for space and time lower+upper bounds
             f.createDimension("nv", 2)
             # space coordinate dimensions and coordinate variables
             for axis in axes:
+                coord = field.dim(axis)
                 # dimension (domain axis)
-                f.createDimension(axis, len(getattr(self._spacedomain, axis)))
+                f.createDimension(axis, coord.size)
                 # variables
                 # (domain coordinate)
-                coord = self._spacedomain.to_field().dim(axis)
                 a = f.createVariable(axis, dtype_float(), (axis,))
                 a.standard_name = coord.standard_name
                 a.units = coord.units
@@ -399,6 +400,10 @@ class RecordStream(object):
 
         with Dataset(self.dump_file, "w") as f:
             axes = self._spacedomain.axes
+            # get the coordinate along each axis from one single copy
+            # of the spacedomain field rather than a copy for each axis
+            field = self._spacedomain.to_field()
+            coords = {axis: field.dim(axis) for axis in axes}
 
             # description
             f.description = (
@@ -410,7 +415,7 @@ class RecordStream(object):
             f.createDimension("time", None)
             f.createDimension("length", self._steps_per_slice)
             for axis in axes:
-                f.createDimension(axis, len(getattr(self._spacedomain, axis)))
+                f.createDimension(axis, coords[axis].size)
             f.createDimension("nv", 2)
 
             # coordinate variables
@@ -421,7 +426,7 @@ class RecordStream(object):
             h = f.createVariable("length", np.uint32, ("length",))
             h[:] = np.arange(self._steps_per_slice)
             for axis in axes:
-                coord = self._spacedomain.to_field().dim(axis)
+                coord = coords[axis]
                 # (domain coordinate)
                 a = f.createVariable(axis, dtype_float(), (axis,))
                 a.standard_name = coord.standard_name
@@ -459,15 +464,20 @@ class RecordStream(object):
 
     def update_record_stream_dump(self, timestamp):
         with Dataset(self.dump_file, "a") as f:
-            try:
-                # check whether given snapshot already in file
-                t = cftime.time2index(timestamp, f.variables["time"])
-            # will get a IndexError if time variable is empty
-            # will get a ValueError if timestamp not in time variable
-            except (IndexError, ValueError):
-                # if not, extend time dimension
-                t = len(f.variables["time"])
-                f.variables["time"][t] = timestamp
+            time_ = f.variables["time"]
+            t = len(time_)
+            if t == 0 or timestamp > time_[-1]:
+                # snapshot is after the last one in file (most common case),
+                # so extend time dimension straight away
+                time_[t] = timestamp
+            else:
+                try:
+                    # check whether given snapshot already in file
+                    t = cftime.time2index(timestamp, time_)
+                # will get a ValueError if timestamp not in time variable
+                except ValueError:
+                    # if not, extend time dimension
+                    time_[t] = timestamp
 
             for name in self._records:
                 f.variables[name][t, ...] = self._arrays[name]
@@ -141,32 +141,41 @@ def create_states_dump(filepath, states_info, solver_history, timedomain, spaced
             f"{datetime.now().strftime('%Y-%m-%d at %H:%M:%S')}"
         )
 
+        # get the coordinate along each axis from one single copy of
+        # the spacedomain field rather than a new copy for each axis
+        field = spacedomain.to_field()
+        coords = {axis: field.dim(axis) for axis in axes}
+
         # dimensions
         f.createDimension("time", None)
         f.createDimension("history", solver_history + 1)
         for axis in axes:
-            f.createDimension(axis, len(getattr(spacedomain, axis)))
+            f.createDimension(axis, coords[axis].size)
         f.createDimension("nv", 2)
 
         # coordinate variables
+        # (only defined here, their values are collected to be written
+        #  once all the metadata is defined to avoid alternating between
+        #  definition and data writing for each variable)
+        values = []
         t = f.createVariable("time", np.float64, ("time",))
         t.standard_name = "time"
         t.units = timedomain.units
         t.calendar = timedomain.calendar
         h = f.createVariable("history", np.int8, ("history",))
-        h[:] = np.arange(-solver_history, 1, 1)
+        values.append((h, np.arange(-solver_history, 1, 1, dtype=np.int8)))
         for axis in axes:
-            coord = spacedomain.to_field().dim(axis)
+            coord = coords[axis]
             # (domain coordinate)
             a = f.createVariable(axis, dtype_float(), (axis,))
             a.standard_name = coord.standard_name
             a.units = coord.units
             a.bounds = f"{axis}_bounds"
-            a[:] = coord.data.array
+            values.append((a, coord.data.array))
             # (domain coordinate bounds)
             b = f.createVariable(f"{axis}_bounds", dtype_float(), (axis, "nv"))
             b.units = coord.units
-            b[:] = coord.bounds.data.array
+            values.append((b, coord.bounds.data.array))
 
         # state variables
         for var in states_info:
@@ -181,27 +190,42 @@ def create_states_dump(filepath, states_info, solver_history, timedomain, spaced
             else:
                 dims = ("time", "history", *axes)
 
-            s = f.createVariable(var, dtype_float(), dims)
+            # align chunks with the write pattern of the dump updates,
+            # i.e. whole history of the state for a single time
+            chunks = (1, *(len(f.dimensions[dim]) for dim in dims[1:]))
+
+            s = f.createVariable(var, dtype_float(), dims, chunksizes=chunks)
 
             s.standard_name = var
             s.units = states_info[var]["units"]
 
+        # coordinate values
+        for variable, value in values:
+            variable[:] = value
+
 
 def update_states_dump(filepath, states, timestamp, solver_history):
     with Dataset(filepath, "a") as f:
-        try:
-            # check whether given snapshot already in file
-            t = cftime.time2index(timestamp, f.variables["time"])
-        # will get a IndexError if time variable is empty
-        # will get a ValueError if timestamp not in time variable
-        except (IndexError, ValueError):
-            # if not, extend time dimension
-            t = len(f.variables["time"])
-            f.variables["time"][t] = timestamp
+        time_ = f.variables["time"]
+        t = len(time_)
+        if t == 0 or timestamp > time_[-1]:
+            # snapshot is after the last one in file (most common case),
+            # so extend time dimension straight away
+            time_[t] = timestamp
+        else:
+            try:
+                # check whether given snapshot already in file
+                t = cftime.time2index(timestamp, time_)
+            # will get a ValueError if timestamp not in time variable
+            except ValueError:
+                # if not, extend time dimension
+                time_[t] = timestamp
 
         for state in states:
-            for i, step in enumerate(range(-solver_history, 1, 1)):
-                f.variables[state][t, i, ...] = states[state].get_timestep(step)
+            # write whole history of the state in one go
+            f.variables[state][t, ...] = np.stack(
+                states[state].get_timestep(slice(-solver_history, None)), axis=0
+            )
 
 
 def load_states_dump(filepath, datetime_, states_info):
@@ -225,11 +249,10 @@ def load_states_dump(filepath, datetime_, states_info):
             except ValueError:
                 raise ValueError(f"{datetime_} not available in dump {filepath}")
 
-        # try to get each of the states, if not in file, carry on anyway
+        # get each of the states, if not in file, carry on anyway
+        variables = f.variables
         for state in states_info:
-            try:
-                states[state] = f.variables[state][t, ...]
-            except KeyError:
-                pass
+            if state in variables:
+                states[state] = variables[state][t, ...]
 
     return states, datetime_
@@ -430,6 +430,7 @@ class Component(metaclass=MetaComponent):
         # directories and files
         self.saving_directory = saving_directory
         self.dump_file = None
+        self._dump_path = None
 
         # special attribute to store information that can be communicated
         # between component methods (typically between `initialise` and `run`)
@@ -1182,8 +1183,11 @@ class Component(metaclass=MetaComponent):
     def run_(self, timeindex, exchanger):
         data = {}
         # collect required input data from dataset
-        for d in self._inputs_info:
-            data[d] = self.datasubset[d][timeindex]
+        # (iterating over the items of the data subset, which only holds
+        #  the required inputs, rather than looking each input up through
+        #  the mapping interface of the dataset)
+        for d, variable in self.datasubset.items():
+            data[d] = variable[timeindex]
 
         # determine current datetime in simulation
         self._current_datetime = self._datetime_array[timeindex]
@@ -1209,7 +1213,7 @@ class Component(metaclass=MetaComponent):
     def finalise_(self):
         timestamp = self.timedomain.bounds.array[-1, -1]
         update_states_dump(
-            sep.join([self.saving_directory, self.dump_file]),
+            self._dump_path,
             self.states,
             timestamp,
             self._solver_history,
@@ -1234,11 +1238,11 @@ class Component(metaclass=MetaComponent):
         self.dump_file = "_".join(
             [self.identifier, self._category, tag, "dump_states.nc"]
         )
-        if overwrite or not path.exists(
-            sep.join([self.saving_directory, self.dump_file])
-        ):
+        # build path to dump file once for all the dumps to come
+        self._dump_path = sep.join([self.saving_directory, self.dump_file])
+        if overwrite or not path.exists(self._dump_path):
             create_states_dump(
-                sep.join([self.saving_directory, self.dump_file]),
+                self._dump_path,
                 self._states_info,
                 self._solver_history,
                 self.timedomain,
@@ -1297,7 +1301,7 @@ class Component(metaclass=MetaComponent):
     def dump_states(self, timeindex):
         timestamp = self.timedomain.bounds.array[timeindex, 0]
         update_states_dump(
-            sep.join([self.saving_directory, self.dump_file]),
+            self._dump_path,
             self.states,
             timestamp,
             self._solver_history,
@@ -93,6 +93,25 @@ class DataSet(MutableMapping):
     def __len__(self):
         return len(self._variables)
 
+    # read-only access is delegated directly to the underlying dict
+    # rather than relying on the generic implementations of the mixin
+    # methods inherited from MutableMapping (writing access remains
+    # through __setitem__ to keep the type checking of the values)
+    def __contains__(self, key):
+        return key in self._variables
+
+    def get(self, key, default=None):
+        return self._variables.get(key, default)
+
+    def keys(self):
+        return self._variables.keys()
+
+    def values(self):
+        return self._variables.values()
+
+    def items(self):
+        return self._variables.items()
+
     def __str__(self):
         return (
             "\n".join(
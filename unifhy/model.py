@@ -4,6 +4,11 @@ from datetime import datetime, timedelta
 import re
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from ._utils import Exchanger, Clock, Compass
 from ._utils.exchanger import load_transfers_dump
 from .component import (
@@ -19,6 +24,12 @@ from .component import (
 from .time import TimeDomain
 
 
+class _Loader(_SafeLoader):
+    # private loader so that the custom YAML tags registered by Model
+    # do not leak into the loader shared by other PyYAML users
+    pass
+
+
 class Model(object):
     r"""Model is the core element of the modelling framework.
 
@@ -265,11 +276,12 @@ class Model(object):
                     )
                 }
             ),
-            Loader=yaml.FullLoader,
+            Loader=_Loader,
         )
         yaml.add_implicit_resolver(
             "!timedelta",
             re.compile(r"timedelta\(( *([a-z]+) *= *([0-9]+\.?[0-9]*) *,?)+\)"),
+            Loader=_Loader,
         )
 
     @staticmethod
@@ -291,9 +303,11 @@ class Model(object):
             ),
             Dumper=yaml.Dumper,
         )
-        yaml.add_implicit_resolver(
+        # (only registered on the dumper, the loader is set up separately)
+        yaml.Dumper.add_implicit_resolver(
             "!timedelta",
             re.compile(r"timedelta\(( *([a-z]+) *= *([0-9]+\.?[0-9]*) *,?)+\)"),
+            None,
         )
 
     @classmethod
@@ -330,7 +344,7 @@ class Model(object):
         cls._set_up_yaml_loader()
 
         with open(yaml_file, "r") as f:
-            cfg = yaml.load(f, yaml.FullLoader)
+            cfg = yaml.load(f, _Loader)
         return cls.from_config(cfg)
 
     def to_yaml(self):
@@ -421,7 +435,7 @@ class Model(object):
                 if self.exchanger.transfers[tr].get("from") is None:
                     continue
                 else:
-                    self.exchanger.transfers[tr]["slices"][-1] = transfers[tr]
+                    self.exchanger.set_transfer(tr, transfers[tr])
             else:
                 raise KeyError(
                     f"initial conditions for exchanger transfer '{tr}' " f"not in dump"
@@ -777,7 +791,7 @@ class Model(object):
         self._set_up_yaml_loader()
         try:
             with open(yaml_sig.replace("*", method), "r") as f:
-                cfg = yaml.load(f, yaml.FullLoader)
+                cfg = yaml.load(f, _Loader)
         except FileNotFoundError:
             raise FileNotFoundError("no configuration file found")
 